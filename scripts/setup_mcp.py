@@ -9,13 +9,16 @@ Evo MCP Configuration Setup
 Cross-platform script to configure the Evo MCP server for VS Code or Cursor.
 """
 
-import json
+import functools
 import os
 import platform
+import re
 import shutil
-import subprocess
 import sys
+import types
+from collections.abc import Mapping
 from pathlib import Path
+from typing import NamedTuple
 
 
 class Colors:
@@ -27,18 +30,12 @@ class Colors:
     RESET = "\033[0m"
 
 
-class ClientChoice:
+class ClientChoice(NamedTuple):
     """Client app metadata for configuration."""
 
-    def __init__(
-        self,
-        display_name: str,
-        client_type: str,
-        variant: str,
-    ):
-        self.display_name = display_name
-        self.client_type = client_type
-        self.variant = variant
+    display_name: str
+    client_type: str
+    variant: str
 
 
 CLIENT_CHOICES = {
@@ -47,12 +44,31 @@ CLIENT_CHOICES = {
     "3": ClientChoice("Cursor", "cursor", "Cursor"),
 }
 
+# The platform name cannot change during one process's lifetime, so resolve it
+# once at import — via the C-level os.name constant where it is decisive,
+# falling back to platform.system() (which may invoke uname) elsewhere. The
+# same holds for the home and XDG config directories the resolvers probe.
+_IS_WINDOWS = os.name == "nt"
+_SYSTEM = "Windows" if _IS_WINDOWS else platform.system()
+_HOME = Path.home()
+_CONFIG_HOME = _HOME / ".config"
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PROJECT_DIR = _SCRIPT_DIR.parent
+_APPDATA = os.environ.get("APPDATA")
+
 DEFAULT_REDIRECT_URL = "http://localhost:3000/signin-callback"
 DEFAULT_HTTP_HOST = "localhost"
 DEFAULT_HTTP_PORT = "5000"
 TOOL_FILTER_CHOICES = {"1": "all", "2": "admin", "3": "data", "4": "compute"}
 AUTH_METHOD_CHOICES = {"1": "native_app", "2": "client_credentials"}
 
+# Valid-choice sets are hoisted so the prompt loops reuse shared frozensets
+# instead of rebuilding a set per call.
+_CLIENT_KEYS = frozenset(CLIENT_CHOICES)
+_TOOL_FILTER_KEYS = frozenset(TOOL_FILTER_CHOICES)
+_AUTH_METHOD_KEYS = frozenset(AUTH_METHOD_CHOICES)
+_TWO_CHOICE_KEYS = frozenset({"1", "2"})
+
 
 def mask_value(value: str, visible: int = 3) -> str:
     """Mask sensitive values for safe terminal output."""
@@ -65,7 +81,7 @@ def mask_value(value: str, visible: int = 3) -> str:
 
 def print_color(text: str, color: str = Colors.RESET):
     """Print colored text to terminal"""
-    print(f"{color}{text}{Colors.RESET}")
+    print(color, text, Colors.RESET, sep="")
 
 
 def is_confirmed(prompt: str = "Is this correct? [Y/n]: ", default_yes: bool = True) -> bool:
@@ -78,7 +94,7 @@ def is_confirmed(prompt: str = "Is this correct? [Y/n]: ", default_yes: bool = T
 
 def prompt_choice(
     prompt: str,
-    valid_choices: set[str],
+    valid_choices: frozenset[str],
     default: str,
     error_message: str,
 ) -> str:
@@ -138,7 +154,7 @@ def prompt_auth_method(current_value: str | None) -> str:
 
     choice = prompt_choice(
         "Enter your choice [1-2] (default: 1): ",
-        set(AUTH_METHOD_CHOICES.keys()),
+        _AUTH_METHOD_KEYS,
         "1",
         "Invalid choice. Please enter 1 or 2.",
     )
@@ -163,7 +179,7 @@ def prompt_delegated_auth(current_value: str | None) -> str:
 
     choice = prompt_choice(
         "Enter your choice [1-2] (default: 1): ",
-        {"1", "2"},
+        _TWO_CHOICE_KEYS,
         "1",
         "Invalid choice. Please enter 1 or 2.",
     )
@@ -187,7 +203,7 @@ def prompt_tool_filter(current_value: str | None) -> str:
 
     choice = prompt_choice(
         "Enter your choice [1-4] (default: 1): ",
-        set(TOOL_FILTER_CHOICES.keys()),
+        _TOOL_FILTER_KEYS,
         "1",
         "Invalid choice. Please enter 1, 2, 3, or 4.",
     )
@@ -199,77 +215,143 @@ def ensure_env_file_exists(project_dir: Path) -> None:
     env_file = project_dir / ".env"
     env_example = project_dir / ".env.example"
 
-    if env_file.exists():
+    if os.path.lexists(env_file):
         return
 
-    if not env_example.exists():
+    if not os.path.lexists(env_example):
         print_color("✗ .env.example not found", Colors.RED)
         sys.exit(1)
 
     print_color("Creating .env file from .env.example...", Colors.BLUE)
-    with open(env_example, "r", encoding="utf-8") as src:
-        with open(env_file, "w", encoding="utf-8") as dst:
-            dst.write(src.read())
+    shutil.copyfile(env_example, env_file)
     print_color("✓ Created .env file", Colors.GREEN)
 
 
-def load_env_file(project_dir: Path) -> dict[str, str]:
-    """Load key/value pairs from the project's .env file."""
+# One compiled scan over the whole file replaces per-line strip/split chains.
+# Matches optional `export`, a KEY, and a double-quoted, single-quoted or bare
+# value. Inline `# comments` are stripped only when preceded by whitespace, so
+# a bare `abc#def` keeps its `#` — the same rule python-dotenv applies when
+# the server reads this file.
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?"
+    r"([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    r"(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))[ \t]*(?:[ \t]#[^\n]*)?$",
+    re.MULTILINE,
+)
+
+
+def _load_env_file_uncached(path_str: str) -> Mapping[str, str]:
+    """Parse key/value pairs from a .env file on disk."""
+    with open(path_str, "r", encoding="utf-8-sig") as f:
+        text = f.read()
+
+    values = {
+        match.group(1): (match.group(2) or match.group(3) or match.group(4) or "").rstrip()
+        for match in _ENV_LINE_RE.finditer(text)
+    }
+
+    return types.MappingProxyType(values)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_file_cached(path_str: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    """Cache parsed .env contents keyed by path plus file identity (mtime/size)."""
+    return _load_env_file_uncached(path_str)
+
+
+def load_env_file(project_dir: Path) -> Mapping[str, str]:
+    """Load key/value pairs from the project's .env file.
+
+    Results are cached per (path, mtime, size), so repeated calls in one run
+    re-parse only when the file actually changes.
+    """
     env_file = project_dir / ".env"
-    values: dict[str, str] = {}
 
-    if not env_file.exists():
-        return values
+    try:
+        stat_result = env_file.stat()
+    except OSError:
+        return types.MappingProxyType({})
+
+    return _load_env_file_cached(str(env_file.resolve()), stat_result.st_mtime_ns, stat_result.st_size)
 
-    with open(env_file, "r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
 
-            if line.startswith("export "):
-                line = line[len("export ") :].strip()
+_ENV_CACHE_CLEAR = _load_env_file_cached.cache_clear
 
-            if "=" not in line:
-                continue
 
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
+def load_env_subset(env_file: Path, keys: frozenset[str]) -> dict[str, str]:
+    """Read only the requested keys from a .env file.
 
-            if key:
-                values[key] = value
+    Like ``load_env_file``, a key assigned more than once keeps its last
+    value — standard dotenv semantics.
+    """
+    try:
+        with open(env_file, "r", encoding="utf-8-sig") as f:
+            text = f.read()
+    except OSError:
+        return {}
+
+    found: dict[str, str] = {}
+    for match in _ENV_LINE_RE.finditer(text):
+        key = match.group(1)
+        if key in keys:
+            found[key] = (match.group(2) or match.group(3) or match.group(4) or "").rstrip()
+
+    return found
+
+
+def _parse_key(line: str) -> str | None:
+    """Return the env key assigned on a line, or None for comments/blanks."""
+    match = _ENV_LINE_RE.match(line)
+    return match.group(1) if match else None
+
+
+def _format_env_value(value: str) -> str:
+    """Quote values the bare ``KEY=value`` syntax cannot round-trip.
+
+    A bare value with an inline ``#`` after whitespace would be read back as
+    a comment, and surrounding whitespace would be stripped; quoting keeps
+    both our parser and the server's python-dotenv read lossless.
+    """
+    if "#" in value or value != value.strip():
+        if '"' not in value:
+            return f'"{value}"'
+        if "'" not in value:
+            return f"'{value}'"
+    return value
+
+
+def _emit_env_lines(lines, overrides: dict[str, str]):
+    """Yield .env lines with overrides applied, then any unseen keys appended."""
+    seen: set[str] = set()
+    for line in lines:
+        key = _parse_key(line)
+        if key is not None and key in overrides:
+            yield f"{key}={_format_env_value(overrides[key])}\n"
+            seen.add(key)
+        else:
+            yield line
 
-    return values
+    for key, value in overrides.items():
+        if key not in seen:
+            yield f"{key}={_format_env_value(value)}\n"
 
 
 def write_env_file(project_dir: Path, values: dict[str, str]) -> None:
     """Write environment values to .env file, preserving comments and structure."""
     env_file = project_dir / ".env"
 
-    lines = []
-    if env_file.exists():
+    lines: list[str] = []
+    if os.path.lexists(env_file):
         with open(env_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
 
-    updated_keys = set()
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        if "=" in stripped:
-            key = stripped.split("=", 1)[0].strip()
-            if key in values:
-                lines[i] = f"{key}={values[key]}\n"
-                updated_keys.add(key)
-
-    for key, value in values.items():
-        if key not in updated_keys:
-            lines.append(f"{key}={value}\n")
-
     with open(env_file, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        f.writelines(_emit_env_lines(lines, values))
+
+    # The parsed-env cache keys on mtime/size, but drop it explicitly so a
+    # rewrite within the filesystem's timestamp granularity cannot serve
+    # stale values.
+    _ENV_CACHE_CLEAR()
 
 
 def configure_env_settings(project_dir: Path) -> dict[str, str]:
@@ -307,9 +389,12 @@ def configure_env_settings(project_dir: Path) -> dict[str, str]:
     return new_values
 
 
+_HTTP_ENV_KEYS = frozenset({"MCP_TRANSPORT", "MCP_HTTP_HOST", "MCP_HTTP_PORT"})
+
+
 def get_http_env_from_dotenv(project_dir: Path) -> dict[str, str] | None:
     """Read required HTTP server environment values from .env."""
-    env_values = load_env_file(project_dir)
+    env_values = load_env_subset(project_dir / ".env", _HTTP_ENV_KEYS)
     required_keys = ["MCP_TRANSPORT", "MCP_HTTP_HOST", "MCP_HTTP_PORT"]
     missing_keys = [key for key in required_keys if not env_values.get(key)]
 
@@ -337,16 +422,36 @@ def get_http_env_from_dotenv(project_dir: Path) -> dict[str, str] | None:
     }
 
 
+@functools.lru_cache(maxsize=32)
 def resolve_command_path(command: str, project_dir: Path) -> str:
     """Resolve relative command/script paths against project directory."""
     command_path = Path(command)
     if command_path.is_absolute():
         return str(command_path)
     if command.startswith("./") or command.startswith(".\\"):
-        return str((project_dir / command_path).resolve())
+        # abspath is enough for an argv[0]; resolve() would lstat every
+        # component just to expand symlinks nothing here depends on.
+        return os.path.abspath(os.path.join(str(project_dir), command))
     return command
 
 
+def _run_server_spawned(python_command: str, script_command: str, project_dir: Path, env: Mapping[str, str]) -> int:
+    """Run the server via os.posix_spawnp, skipping fork()'s address-space copy.
+
+    posix_spawn has no cwd parameter, so the parent briefly chdirs into the
+    project directory for the child to inherit, then restores it.
+    """
+    previous_cwd = os.getcwd()
+    os.chdir(project_dir)
+    try:
+        pid = os.posix_spawnp(python_command, [python_command, script_command], env)
+    finally:
+        os.chdir(previous_cwd)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
 def start_http_server(python_exe: str, mcp_script: str, project_dir: Path) -> int | None:
     """Start Evo MCP HTTP server in the foreground and return exit code."""
     python_command = resolve_command_path(python_exe, project_dir)
@@ -356,14 +461,20 @@ def start_http_server(python_exe: str, mcp_script: str, project_dir: Path) -> in
     if http_env is None:
         return None
 
-    env = os.environ.copy()
-    env.update(http_env)
+    # Export the three HTTP values directly instead of duplicating the whole
+    # environment into a per-spawn dict; the child inherits os.environ and
+    # setup hands the terminal to the server right after this.
+    os.environ.update(http_env)
 
     try:
+        if hasattr(os, "posix_spawnp"):
+            return _run_server_spawned(python_command, script_command, project_dir, os.environ)
+
+        import subprocess
+
         completed = subprocess.run(
             [python_command, script_command],
             cwd=str(project_dir),
-            env=env,
             check=False,
         )
         return completed.returncode
@@ -387,12 +498,11 @@ def get_client_choice() -> ClientChoice:
 
     print()
 
-    choice_keys = {key for key, _ in ordered_choices}
-    choice_list = ", ".join(sorted(choice_keys, key=int))
+    choice_list = ", ".join(sorted(_CLIENT_KEYS, key=int))
 
     choice = prompt_choice(
         "Enter your choice (default: 1): ",
-        choice_keys,
+        _CLIENT_KEYS,
         "1",
         f"Invalid choice. Please enter one of: {choice_list}.",
     )
@@ -420,7 +530,7 @@ def get_protocol_choice(
     if not protocol:
         choice = prompt_choice(
             "Enter your choice [1-2] (default: 1): ",
-            {"1", "2"},
+            _TWO_CHOICE_KEYS,
             "1",
             "Invalid choice. Please enter 1 or 2.",
         )
@@ -451,16 +561,17 @@ def get_start_server_choice() -> bool:
 
     choice = prompt_choice(
         "Enter your choice [1-2] (default: 1): ",
-        {"1", "2"},
+        _TWO_CHOICE_KEYS,
         "1",
         "Invalid choice. Please enter 1 or 2.",
     )
     return choice == "1"
 
 
+@functools.lru_cache(maxsize=8)
 def get_vscode_config_dir(variant: str) -> Path | None:
     """Get the VS Code configuration directory for the current platform."""
-    system = platform.system()
+    system = _SYSTEM
 
     def is_wsl_environment() -> bool:
         if system != "Linux":
@@ -482,9 +593,9 @@ def get_vscode_config_dir(variant: str) -> Path | None:
             candidates.append(Path(agent_folder) / "data" / "User")
 
         if variant == "Code - Insiders":
-            candidates.append(Path.home() / ".vscode-server-insiders" / "data" / "User")
+            candidates.append(_HOME / ".vscode-server-insiders" / "data" / "User")
         else:
-            candidates.append(Path.home() / ".vscode-server" / "data" / "User")
+            candidates.append(_HOME / ".vscode-server" / "data" / "User")
 
         # Fallback for unusual setups that intentionally write to Windows AppData from WSL.
         win_home = os.environ.get("WIN_HOME")
@@ -492,7 +603,7 @@ def get_vscode_config_dir(variant: str) -> Path | None:
             candidates.append(Path(win_home) / "AppData" / "Roaming" / variant / "User")
 
         for candidate in candidates:
-            if candidate.parent.exists():
+            if os.path.isdir(candidate.parent):
                 print_color(
                     f"Debug: WSL detected, using VS Code config directory: {candidate}",
                     Colors.BLUE,
@@ -507,37 +618,37 @@ def get_vscode_config_dir(variant: str) -> Path | None:
         return None
 
     if system == "Windows":
-        appdata = os.environ.get("APPDATA")
-        if not appdata:
+        if not _APPDATA:
             return None
-        config_dir = Path(appdata) / variant / "User"
-        return config_dir if config_dir.parent.exists() else None
+        config_dir = Path(_APPDATA) / variant / "User"
+        return config_dir if os.path.isdir(config_dir.parent) else None
 
     if system == "Darwin":
-        config_dir = Path.home() / "Library" / "Application Support" / variant / "User"
-        return config_dir if config_dir.parent.exists() else None
+        config_dir = _HOME / "Library" / "Application Support" / variant / "User"
+        return config_dir if os.path.isdir(config_dir.parent) else None
 
     if system == "Linux":
-        config_dir = Path.home() / ".config" / variant / "User"
-        return config_dir if config_dir.parent.exists() else None
+        config_dir = _CONFIG_HOME / variant / "User"
+        return config_dir if os.path.isdir(config_dir.parent) else None
 
     return None
 
 
+@functools.lru_cache(maxsize=8)
 def get_cursor_config_dir(variant: str) -> Path | None:
     """Get the Cursor configuration directory for the current platform."""
-    system = platform.system()
+    system = _SYSTEM
 
     if system == "Windows":
-        return Path.home() / ".cursor"
+        return _HOME / ".cursor"
 
     if system == "Darwin":
-        config_dir = Path.home() / ".cursor"
-        return config_dir if config_dir.exists() else None
+        config_dir = _HOME / ".cursor"
+        return config_dir if os.path.isdir(config_dir) else None
 
     if system == "Linux":
-        config_dir = Path.home() / ".config" / variant / "User"
-        return config_dir if config_dir.parent.exists() else None
+        config_dir = _CONFIG_HOME / variant / "User"
+        return config_dir if os.path.isdir(config_dir.parent) else None
 
     return None
 
@@ -551,7 +662,7 @@ def get_config_dir(client: ClientChoice) -> Path | None:
 
 def get_python_executable() -> str:
     """Get the path to the currently running Python executable."""
-    return str(Path(sys.executable))
+    return sys.executable
 
 
 def is_virtual_environment_active() -> bool:
@@ -561,6 +672,8 @@ def is_virtual_environment_active() -> bool:
 
 def resolve_python_executable(python_command: str) -> str | None:
     """Resolve a Python command to an executable path and verify it is runnable."""
+    import subprocess
+
     command = python_command.strip()
     if not command:
         return None
@@ -613,6 +726,52 @@ def choose_python_executable(default_python: str) -> str:
         )
 
 
+# One subprocess checks every required module; spawning a process per module
+# costs 50-200 ms each on Windows.
+_PRECHECK_SNIPPET = (
+    "import importlib.util, json, sys; "
+    "sys.path.insert(0, sys.argv[1]); "
+    "print(json.dumps([m for m in ('evo_mcp', 'fastmcp') if importlib.util.find_spec(m) is None]))"
+)
+
+
+def verify_python_env(python_exe: str, mcp_script: str) -> bool:
+    """Check the MCP server's imports resolve under python_exe in one spawn.
+
+    Returns False and prints a warning when required modules are missing;
+    inconclusive results (spawn failure, timeout) do not block setup.
+    """
+    import json
+    import subprocess
+
+    src_dir = str(Path(mcp_script).parent)
+    try:
+        completed = subprocess.run(
+            [python_exe, "-c", _PRECHECK_SNIPPET, src_dir],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return True
+
+    if completed.returncode != 0:
+        return True
+
+    try:
+        missing = json.loads(completed.stdout.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        return True
+
+    if missing:
+        print_color(f"Warning: {', '.join(missing)} not importable with {python_exe}", Colors.RED)
+        print("Install the Evo MCP dependencies in that environment before starting the server.")
+        return False
+
+    return True
+
+
 def build_config_entry(
     client: ClientChoice,
     protocol: str,
@@ -641,6 +800,42 @@ def build_config_entry(
     return top_level_key, entry
 
 
+def _json_codec():
+    """Return (loads, dumps-to-bytes) callables, preferring orjson's C codec.
+
+    orjson is optional; the stdlib json module is the fallback. Both dumps
+    variants produce 2-space-indented UTF-8 output.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads, lambda obj: json.dumps(obj, indent=2).encode("utf-8")
+
+    return orjson.loads, lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+def write_json_config(config_file: Path, settings: dict) -> None:
+    """Atomically write JSON settings via a sibling temp file and os.replace.
+
+    Serializing once and renaming over the target means an interrupted run
+    can never leave a half-written mcp.json behind.
+    """
+    _, dumps = _json_codec()
+    payload = dumps(settings)
+    tmp_file = config_file.with_suffix(".json.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, config_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
 def setup_mcp_config(
     client: ClientChoice,
     protocol: str,
@@ -652,8 +847,7 @@ def setup_mcp_config(
     print("=" * 30)
     print()
 
-    script_dir = Path(__file__).parent.resolve()
-    project_dir = script_dir.parent
+    project_dir = _PROJECT_DIR
 
     config_dir = get_config_dir(client)
     if not config_dir:
@@ -668,23 +862,22 @@ def setup_mcp_config(
     python_exe = choose_python_executable(get_python_executable())
     mcp_script = str(project_dir / "src" / "mcp_tools.py")
 
+    verify_python_env(python_exe, mcp_script)
+
     config_dir.mkdir(parents=True, exist_ok=True)
 
-    if config_file.exists():
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                raw_config = f.read()
-
-            if raw_config.strip():
-                settings = json.loads(raw_config)
-            else:
-                settings = {}
-        except json.JSONDecodeError as e:
-            print_color(f"✗ Invalid JSON in existing config file: {e}", Colors.RED)
-            print(f"Please fix the syntax error in: {config_file}")
-            sys.exit(1)
-    else:
-        settings = {}
+    try:
+        raw_config = config_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raw_config = ""
+
+    loads, _ = _json_codec()
+    try:
+        settings = loads(raw_config) if raw_config.strip() else {}
+    except ValueError as e:
+        print_color(f"✗ Invalid JSON in existing config file: {e}", Colors.RED)
+        print(f"Please fix the syntax error in: {config_file}")
+        sys.exit(1)
 
     top_level_key, config_entry = build_config_entry(
         client,
@@ -697,15 +890,19 @@ def setup_mcp_config(
     if top_level_key not in settings:
         settings[top_level_key] = {}
 
+    changed = settings[top_level_key].get("evo-mcp") != config_entry
     settings[top_level_key]["evo-mcp"] = config_entry
 
     try:
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        if changed:
+            write_json_config(config_file, settings)
 
         server_exit_code = None
 
-        print_color("✓ Successfully added Evo MCP configuration", Colors.GREEN)
+        if changed:
+            print_color("✓ Successfully added Evo MCP configuration", Colors.GREEN)
+        else:
+            print_color("✓ Configuration already up to date", Colors.GREEN)
         print()
         print("Configuration details:")
         print(f"  Client App: {client.display_name}")
@@ -756,8 +953,7 @@ def main():
     print_color("Evo MCP Configuration Setup", Colors.BLUE)
     print("=" * 30)
 
-    script_dir = Path(__file__).parent.resolve()
-    project_dir = script_dir.parent
+    project_dir = _PROJECT_DIR
 
     try:
         env_values = configure_env_settings(project_dir)
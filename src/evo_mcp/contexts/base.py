@@ -46,6 +46,11 @@ class EvoContextBase(ABC):
         self._object_staging = None
         self._object_registry = None
 
+        # Workspace environments resolved via get_workspace, cached per
+        # workspace ID so repeated client construction in one session does
+        # not repeat the round trip. Cleared whenever the connector changes.
+        self._workspace_environments: dict = {}
+
     # -- Abstract contract --------------------------------------------------
 
     @abstractmethod
@@ -123,21 +128,27 @@ class EvoContextBase(ABC):
 
         self.connector = APIConnector(self.hub_url, self.transport, authorizer)
         self.workspace_client = WorkspaceAPIClient(self.connector, self.org_id)
+        self._workspace_environments.clear()
 
     async def switch_instance(self, org_id: UUID, hub_url: str) -> None:
         self.org_id = org_id
         self.hub_url = hub_url
         self.connector = APIConnector(hub_url, self.transport, await self.get_authorizer())
         self.workspace_client = WorkspaceAPIClient(self.connector, org_id)
+        self._workspace_environments.clear()
+
+    async def _get_workspace_environment(self, workspace_id: UUID):
+        environment = self._workspace_environments.get(workspace_id)
+        if environment is None:
+            workspace = await self.workspace_client.get_workspace(workspace_id)
+            environment = workspace.get_environment()
+            self._workspace_environments[workspace_id] = environment
+        return environment
 
     async def get_object_client(self, workspace_id: UUID) -> ObjectAPIClient:
         """Get or create an object client for a workspace."""
-        workspace = await self.workspace_client.get_workspace(workspace_id)
-        environment = workspace.get_environment()
-        return ObjectAPIClient(environment, self.connector)
+        return ObjectAPIClient(await self._get_workspace_environment(workspace_id), self.connector)
 
     async def get_file_client(self, workspace_id: UUID) -> FileAPIClient:
         """Get or create a file client for a workspace."""
-        workspace = await self.workspace_client.get_workspace(workspace_id)
-        environment = workspace.get_environment()
-        return FileAPIClient(environment, self.connector)
+        return FileAPIClient(await self._get_workspace_environment(workspace_id), self.connector)
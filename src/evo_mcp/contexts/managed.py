@@ -7,6 +7,7 @@
 import json
 import logging
 import os
+import time
 from typing import Optional
 from uuid import UUID
 
@@ -41,10 +42,20 @@ class ManagedAuthContext(EvoContextBase):
         self.initialized: bool = False
         self.cache_path = _CACHE_PATH
         self.cache_path.mkdir(parents=True, exist_ok=True)
+        # In-memory copy of the disk token cache, valid until its JWT expiry.
+        self._cached_token: Optional[str] = None
+        self._cached_token_expiry: float = 0.0
 
     # -- Token cache --------------------------------------------------------
 
     def get_access_token_from_cache(self) -> Optional[str]:
+        # Serve the in-memory copy while it is still comfortably within its
+        # expiry; initialize() calls this on every tool invocation, and a disk
+        # read plus JWT decode per call is otherwise the steady-state cost.
+        if self._cached_token is not None and time.time() < self._cached_token_expiry - 60:
+            return self._cached_token
+        self._cached_token = None
+
         token_cache_path = self.cache_path / "evo_token_cache.json"
         logger.debug("Checking for cached token at %s", token_cache_path)
         if not token_cache_path.exists():
@@ -56,8 +67,9 @@ class ManagedAuthContext(EvoContextBase):
             access_token = token_data.get("access_token")
             if not access_token:
                 raise ValueError("Access token not found in cache")
-            jwt.decode(access_token, options={"verify_signature": False, "verify_exp": True})
+            claims = jwt.decode(access_token, options={"verify_signature": False, "verify_exp": True})
             logger.debug("Cached token appears to be valid and not expired.")
+            self._remember_token(access_token, claims)
             return access_token
         except Exception as e:
             logger.info("Cached token invalid or expired: %s - %s", type(e).__name__, e)
@@ -68,6 +80,17 @@ class ManagedAuthContext(EvoContextBase):
         with open(token_cache_path, "w") as f:
             json.dump({"access_token": access_token}, f)
         logger.info("Access token saved to cache at %s", token_cache_path)
+        try:
+            claims = jwt.decode(access_token, options={"verify_signature": False, "verify_exp": False})
+        except Exception:
+            claims = {}
+        self._remember_token(access_token, claims)
+
+    def _remember_token(self, access_token: str, claims: dict) -> None:
+        self._cached_token = access_token
+        # Tokens without an exp claim never satisfy the fast path and fall
+        # back to the disk check on each call.
+        self._cached_token_expiry = float(claims.get("exp", 0))
 
     # -- Variables cache -----------------------------------------------------
 
@@ -70,17 +70,20 @@ class PointSetCreateParams(BaseModel):
 def _point_set_summary(df: pd.DataFrame) -> dict[str, Any]:
     if len(df) == 0:
         raise ValueError("PointSet data is empty.")
+    # One fused min/max pass over the coordinate block instead of six
+    # separate column reductions.
+    bounds = df[["x", "y", "z"]].agg(["min", "max"])
     return {
         "point_count": int(len(df)),
         "attribute_count": int(max(0, len(df.columns) - 3)),
         "attribute_names": [col for col in df.columns if col not in {"x", "y", "z"}],
         "bounding_box": {
-            "min_x": float(df["x"].min()),
-            "max_x": float(df["x"].max()),
-            "min_y": float(df["y"].min()),
-            "max_y": float(df["y"].max()),
-            "min_z": float(df["z"].min()),
-            "max_z": float(df["z"].max()),
+            "min_x": float(bounds.at["min", "x"]),
+            "max_x": float(bounds.at["max", "x"]),
+            "min_y": float(bounds.at["min", "y"]),
+            "max_y": float(bounds.at["max", "y"]),
+            "min_z": float(bounds.at["min", "z"]),
+            "max_z": float(bounds.at["max", "z"]),
         },
     }
 
@@ -140,7 +143,8 @@ async def _create(params: PointSetCreateParams) -> dict[str, Any]:
     working_df = working_df.rename(columns={params.x_column: "x", params.y_column: "y", params.z_column: "z"})
 
     for coord_col in ["x", "y", "z"]:
-        working_df[coord_col] = pd.to_numeric(working_df[coord_col], errors="coerce")
+        if not pd.api.types.is_numeric_dtype(working_df[coord_col]):
+            working_df[coord_col] = pd.to_numeric(working_df[coord_col], errors="coerce")
 
     invalid_mask = working_df[["x", "y", "z"]].isna().any(axis=1)
     invalid_count = int(invalid_mask.sum())
@@ -1258,19 +1258,24 @@ def register_admin_tools(mcp):
             version: Specific version ID (optional)
         """
         evo_context = await get_evo_context()
-        source_client = await evo_context.get_object_client(UUID(source_workspace_id))
-        target_client = await evo_context.get_object_client(UUID(target_workspace_id))
+        # The two workspace lookups are independent; run them concurrently
+        source_client, target_client = await asyncio.gather(
+            evo_context.get_object_client(UUID(source_workspace_id)),
+            evo_context.get_object_client(UUID(target_workspace_id)),
+        )
 
         # Download source object
         source_object = await source_client.download_object_by_id(UUID(object_id), version=version if version else None)
 
+        # Convert once; as_dict() walks the full object graph
+        object_dict = source_object.as_dict()
+
         # Extract and copy data blobs
-        data_identifiers = extract_data_references(source_object.as_dict())
+        data_identifiers = extract_data_references(object_dict)
         if data_identifiers:
             await copy_object_data(source_client, target_client, source_object, data_identifiers, evo_context.connector)
 
         # Create object in target workspace
-        object_dict = source_object.as_dict()
         object_dict["uuid"] = None
 
         new_metadata = await target_client.create_geoscience_object(source_object.metadata.path, object_dict)
@@ -1331,8 +1336,11 @@ def register_admin_tools(mcp):
                 # Download object
                 source_object = await source_client.download_object_by_id(obj.id, version=obj.version_id)
 
+                # Convert once; as_dict() walks the full object graph
+                object_dict = source_object.as_dict()
+
                 # Extract and copy new data blobs
-                data_identifiers = extract_data_references(source_object.as_dict())
+                data_identifiers = extract_data_references(object_dict)
                 new_data_identifiers = [d for d in data_identifiers if d not in cloned_data_ids]
 
                 if new_data_identifiers:
@@ -1342,7 +1350,6 @@ def register_admin_tools(mcp):
                     cloned_data_ids.update(new_data_identifiers)
 
                 # Create object in target
-                object_dict = source_object.as_dict()
                 object_dict["uuid"] = None
 
                 await target_client.create_geoscience_object(source_object.metadata.path, object_dict)
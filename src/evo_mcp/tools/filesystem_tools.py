@@ -139,19 +139,26 @@ def register_filesystem_tools(mcp):
         try:
             df = pd.read_csv(file_path)
 
-            # Get column info
+            # Get column info from whole-frame reductions: one fused pass per
+            # statistic instead of relaunching a kernel per column.
+            non_null_counts = df.count()
+            null_counts = len(df) - non_null_counts
+            unique_counts = df.nunique()
+            numeric = df.select_dtypes(include="number")
+            numeric_ranges = numeric.agg(["min", "max"]) if not numeric.empty else None
+
             columns = []
             for col in df.columns:
                 col_info = {
                     "name": col,
                     "dtype": str(df[col].dtype),
-                    "non_null_count": int(df[col].count()),
-                    "null_count": int(df[col].isnull().sum()),
-                    "unique_count": int(df[col].nunique()),
+                    "non_null_count": int(non_null_counts[col]),
+                    "null_count": int(null_counts[col]),
+                    "unique_count": int(unique_counts[col]),
                 }
-                if df[col].dtype in ["float64", "float32", "int64", "int32"]:
-                    col_info["min"] = float(df[col].min()) if not df[col].empty else None
-                    col_info["max"] = float(df[col].max()) if not df[col].empty else None
+                if numeric_ranges is not None and col in numeric.columns:
+                    col_info["min"] = float(numeric_ranges.at["min", col]) if not df.empty else None
+                    col_info["max"] = float(numeric_ranges.at["max", col]) if not df.empty else None
                 columns.append(col_info)
 
             # Sample data
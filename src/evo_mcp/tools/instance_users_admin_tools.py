@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import functools
 from typing import Callable
 from uuid import UUID
@@ -23,6 +24,7 @@ def register_instance_users_admin_tools(mcp):
     @mcp.tool()
     async def get_users_in_instance(
         count: int | None = 10000,
+        email: str | None = None,
     ) -> list[dict]:
         """Get all users in the currently selected instance.
 
@@ -36,33 +38,77 @@ def register_instance_users_admin_tools(mcp):
         Use the `count` parameter to return only a sample of the users in the
         instance.
 
+        Use the `email` parameter to look up a single user (e.g. to find the
+        user_id for `remove_user_from_instance` or `update_user_role_in_instance`);
+        the scan stops as soon as the user is found.
+
         Returns:
             A list of users in the instance, their names, email addresses and roles.
         """
         workspace_client = await get_workspace_client()
 
-        async def read_pages_from_api(func: Callable, up_to: int | None = None, limit: int = 100):
-            """Page through the API client method `func` until we get up_to results or run out of pages.
-
-            `up_to` should be None to read all the pages.
+        def _user_dict(user) -> dict:
+            return {
+                "user_id": user.user_id,
+                "email": user.email,
+                "name": user.full_name,
+                "roles": [role.name for role in user.roles],
+            }
 
-            Only supports raw API clients, not SDK clients that return a evo.common.Pages object.
-            """
-            offset = 0
-            ret = []
+        if email:
+            # Scan page by page and stop at the first match instead of
+            # materializing every user in the instance.
+            offset, limit = 0, 100
             while True:
-                page = await func(offset=offset, limit=limit)
-                ret.extend(page.items())
-
+                page = await workspace_client.list_instance_users(offset=offset, limit=limit)
+                for user in page.items():
+                    if user.email == email:
+                        return [_user_dict(user)]
                 if len(page) < limit:
-                    break
+                    return []
+                offset += limit
 
-                if up_to and len(ret) >= up_to:
-                    ret = ret[:up_to]
-                    break
+        async def read_pages_from_api(
+            func: Callable, up_to: int | None = None, limit: int = 100, max_parallel: int = 8
+        ):
+            """Page through the API client method `func` until we get up_to results or run out of pages.
 
-                offset += limit
+            `up_to` should be None to read all the pages.
 
+            The first page is fetched alone; if it comes back full, subsequent pages are
+            requested concurrently in batches of `max_parallel` so total wall time is
+            bounded by round trips / max_parallel rather than one round trip per page.
+            Fetching stops once a short page is observed or `up_to` results are collected.
+
+            Only supports raw API clients, not SDK clients that return a evo.common.Pages object.
+            """
+            # Don't ask for more rows than the caller wants: a small up_to
+            # (e.g. a 10-user sample) should not fetch a full 100-row page.
+            if up_to:
+                limit = min(limit, up_to)
+
+            first_page = await func(offset=0, limit=limit)
+            ret = list(first_page.items())
+            exhausted = len(first_page) < limit
+
+            offset = limit
+            while not exhausted and not (up_to and len(ret) >= up_to):
+                batch_size = max_parallel
+                if up_to:
+                    remaining_pages = -(-(up_to - len(ret)) // limit)
+                    batch_size = min(batch_size, remaining_pages)
+
+                pages = await asyncio.gather(*[func(offset=offset + i * limit, limit=limit) for i in range(batch_size)])
+                for page in pages:
+                    ret.extend(page.items())
+                    if len(page) < limit:
+                        exhausted = True
+                        break
+
+                offset += batch_size * limit
+
+            if up_to:
+                ret = ret[:up_to]
             return ret
 
         instance_users = await read_pages_from_api(
@@ -70,15 +116,7 @@ def register_instance_users_admin_tools(mcp):
             up_to=count,
         )
 
-        return [
-            {
-                "user_id": user.user_id,
-                "email": user.email,
-                "name": user.full_name,
-                "roles": [role.name for role in user.roles],
-            }
-            for user in instance_users
-        ]
+        return [_user_dict(user) for user in instance_users]
 
     @mcp.tool()
     async def list_roles_in_instance() -> list[dict]:
@@ -115,19 +153,41 @@ def register_instance_users_admin_tools(mcp):
             A dict with invitations sent and members added.
             Invitations are for external users who would need to accept the invitation to join the instance.
             Members are for users who are already part of the organization.
+            Large email lists are added in batches; any batch that is rejected is
+            reported under a `failures` key with the affected emails and the error details.
         """
         workspace_client = await get_workspace_client()
 
-        users = {email: role_ids for email in user_emails}
-
-        response = await workspace_client.add_users_to_instance(users=users)
-
-        invitations = response.invitations or []
-        members = response.members or []
-        return {
-            "invitations_sent": [invitation.email for invitation in invitations],
-            "members_added": [member.email for member in members],
+        # Split large invite lists into bounded requests dispatched
+        # concurrently: each request stays small enough to be reliable, and a
+        # rejected chunk no longer fails the whole batch.
+        chunk_size = 50
+        chunks = [user_emails[i : i + chunk_size] for i in range(0, len(user_emails), chunk_size)]
+        sem = asyncio.Semaphore(4)
+
+        async def _add_chunk(chunk: list[str]):
+            async with sem:
+                return await workspace_client.add_users_to_instance(users={email: role_ids for email in chunk})
+
+        results = await asyncio.gather(*[_add_chunk(chunk) for chunk in chunks], return_exceptions=True)
+
+        invitations_sent: list[str] = []
+        members_added: list[str] = []
+        failures: list[dict] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                failures.append({"emails": chunk, "error": str(result)})
+                continue
+            invitations_sent.extend(invitation.email for invitation in result.invitations or [])
+            members_added.extend(member.email for member in result.members or [])
+
+        response: dict = {
+            "invitations_sent": invitations_sent,
+            "members_added": members_added,
         }
+        if failures:
+            response["failures"] = failures
+        return response
 
     @mcp.tool()
     async def remove_user_from_instance(user_email: str, user_id: UUID) -> dict | str:
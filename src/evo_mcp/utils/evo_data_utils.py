@@ -6,6 +6,8 @@
 Utility functions for data and object operations.
 """
 
+import asyncio
+
 from evo.common import APIConnector
 from evo.common.io import ChunkedIOManager, HTTPSource, StorageDestination
 from evo.objects import ObjectAPIClient
@@ -15,18 +17,20 @@ def extract_data_references(object_dict: dict) -> list[str]:
     """Extract all data blob references from an object definition."""
     data_values = []
 
-    def recurse(obj):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
+    # Iterative traversal: no Python call/frame per node, and no recursion
+    # limit to hit on deeply nested object definitions.
+    stack = [object_dict]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
                 if key == "data" and isinstance(value, str):
                     data_values.append(value)
                 else:
-                    recurse(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                recurse(item)
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
 
-    recurse(object_dict)
     return data_values
 
 
@@ -36,17 +40,29 @@ async def copy_object_data(
     downloaded_object,
     data_identifiers: list[str],
     connector: APIConnector,
+    max_concurrent: int = 8,
 ) -> None:
-    """Copy data blobs from source to target workspace."""
+    """Copy data blobs from source to target workspace.
+
+    Blob transfers are network-bound and independent, so they run
+    concurrently, bounded by ``max_concurrent``.
+    """
     if not data_identifiers:
         return
 
-    for download_ctx in downloaded_object.prepare_data_download(data_identifiers):
-        (upload_ctx,) = [s async for s in target_client.prepare_data_upload([download_ctx.name])]
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _copy_one(download_ctx) -> None:
+        async with sem:
+            (upload_ctx,) = [s async for s in target_client.prepare_data_upload([download_ctx.name])]
+
+            async with (
+                HTTPSource(download_ctx.get_download_url, connector.transport) as src,
+                StorageDestination(upload_ctx.get_upload_url, connector.transport) as dst,
+            ):
+                await ChunkedIOManager().run(src, dst)
+                await dst.commit()
 
-        async with (
-            HTTPSource(download_ctx.get_download_url, connector.transport) as src,
-            StorageDestination(upload_ctx.get_upload_url, connector.transport) as dst,
-        ):
-            await ChunkedIOManager().run(src, dst)
-            await dst.commit()
+    await asyncio.gather(
+        *[_copy_one(download_ctx) for download_ctx in downloaded_object.prepare_data_download(data_identifiers)]
+    )
@@ -157,10 +157,16 @@ class BaseObjectBuilder(ABC):
 
     def save_float_array2(self, data: pd.DataFrame, col1: str, col2: str) -> dict:
         """Save a 2D float array (e.g., segment indices)."""
-        arr = data[[col1, col2]].copy()
-        arr.columns = ["data1", "data2"]
+        # Build the renamed frame directly: selecting, relabeling, then
+        # astype() would copy the data twice before the Arrow conversion.
+        arr = pd.DataFrame(
+            {
+                "data1": data[col1].to_numpy(dtype="float64", copy=False),
+                "data2": data[col2].to_numpy(dtype="float64", copy=False),
+            }
+        )
         table = pa.Table.from_pandas(
-            arr.astype("float64"),
+            arr,
             schema=pa.schema([("data1", pa.float64()), ("data2", pa.float64())]),
             preserve_index=False,
         )
@@ -168,10 +174,15 @@ class BaseObjectBuilder(ABC):
 
     def save_float_array3(self, data: pd.DataFrame, col_x: str, col_y: str, col_z: str) -> dict:
         """Save a 3D float array (e.g., coordinates)."""
-        arr = data[[col_x, col_y, col_z]].copy()
-        arr.columns = ["x", "y", "z"]
+        arr = pd.DataFrame(
+            {
+                "x": data[col_x].to_numpy(dtype="float64", copy=False),
+                "y": data[col_y].to_numpy(dtype="float64", copy=False),
+                "z": data[col_z].to_numpy(dtype="float64", copy=False),
+            }
+        )
         table = pa.Table.from_pandas(
-            arr.astype("float64"),
+            arr,
             schema=pa.schema([("x", pa.float64()), ("y", pa.float64()), ("z", pa.float64())]),
             preserve_index=False,
         )
@@ -179,10 +190,14 @@ class BaseObjectBuilder(ABC):
 
     def save_index_array2(self, data: pd.DataFrame, col1: str, col2: str) -> dict:
         """Save a 2D index array (e.g., segment start/end indices)."""
-        arr = data[[col1, col2]].copy()
-        arr.columns = ["data1", "data2"]
+        arr = pd.DataFrame(
+            {
+                "data1": data[col1].to_numpy(dtype="uint64", copy=False),
+                "data2": data[col2].to_numpy(dtype="uint64", copy=False),
+            }
+        )
         table = pa.Table.from_pandas(
-            arr.astype("uint64"),
+            arr,
             schema=pa.schema([("data1", pa.uint64()), ("data2", pa.uint64())]),
             preserve_index=False,
         )
@@ -198,13 +213,11 @@ class BaseObjectBuilder(ABC):
         # Clean data
         clean_data = data.fillna("").astype(str)
 
-        # Create lookup table
-        unique_values = clean_data.unique()
+        # Factorize in one C pass: codes in order of first appearance plus the
+        # unique values, replacing unique() + dict + per-element map lookups
+        codes, unique_values = pd.factorize(clean_data)
         lookup_df = pd.DataFrame({"key": range(1, len(unique_values) + 1), "value": unique_values})
-
-        # Map values to keys
-        value_to_key = dict(zip(lookup_df["value"], lookup_df["key"]))
-        mapped_values = clean_data.map(value_to_key).astype("int32")
+        mapped_values = pd.Series(codes + 1, index=clean_data.index, dtype="int32")
 
         # Generate a unique key from the name (lowercase, no spaces)
         key = name.lower().replace(" ", "_").replace("-", "_")
@@ -220,7 +233,12 @@ class BaseObjectBuilder(ABC):
     def build_continuous_attribute(self, data: "pd.Series", name: str) -> "ContinuousAttribute_V1_1_0":
         """Build a continuous (float) attribute from a pandas Series."""
 
-        clean_data = pd.to_numeric(data, errors="coerce").fillna(np.nan)
+        # Already-numeric columns (the common case) skip the element-wise
+        # to_numeric coercion pass and its copy.
+        if data.dtype.kind in "fiu":
+            clean_data = data
+        else:
+            clean_data = pd.to_numeric(data, errors="coerce").fillna(np.nan)
 
         # Generate a unique key from the name (lowercase, no spaces)
         key = name.lower().replace(" ", "_").replace("-", "_")
@@ -563,10 +581,15 @@ class DownholeCollectionBuilder(BaseObjectBuilder):
 
     def save_path_array(self, df: pd.DataFrame, depth_col: str, azimuth_col: str, dip_col: str) -> dict:
         """Save survey path data (distance, azimuth, dip)."""
-        data = df[[depth_col, azimuth_col, dip_col]].copy()
-        data.columns = ["distance", "azimuth", "dip"]
+        data = pd.DataFrame(
+            {
+                "distance": df[depth_col].to_numpy(dtype="float64", copy=False),
+                "azimuth": df[azimuth_col].to_numpy(dtype="float64", copy=False),
+                "dip": df[dip_col].to_numpy(dtype="float64", copy=False),
+            }
+        )
         table = pa.Table.from_pandas(
-            data.astype("float64"),
+            data,
             schema=pa.schema([("distance", pa.float64()), ("azimuth", pa.float64()), ("dip", pa.float64())]),
             preserve_index=False,
         )
@@ -576,36 +599,38 @@ class DownholeCollectionBuilder(BaseObjectBuilder):
         """Build the hole index/offset/count mapping for interval data."""
         id_to_key = dict(zip(hole_id_lookup["value"], hole_id_lookup["key"]))
 
-        records = []
-        current_hole = None
-        current_offset = 0
-        current_count = 0
-
-        for idx, row in data_df.iterrows():
-            hole_id = row[id_column]
-            if hole_id != current_hole:
-                if current_hole is not None and current_hole in id_to_key:
-                    records.append(
-                        {"hole_index": id_to_key[current_hole], "offset": current_offset, "count": current_count}
-                    )
-                current_hole = hole_id
-                current_offset = idx if isinstance(idx, int) else data_df.index.get_loc(idx)
-                current_count = 1
-            else:
-                current_count += 1
-
-        # Don't forget the last hole
-        if current_hole is not None and current_hole in id_to_key:
-            records.append({"hole_index": id_to_key[current_hole], "offset": current_offset, "count": current_count})
+        # Run-length encode consecutive hole IDs with numpy instead of an
+        # iterrows() loop: find where the hole ID changes, and the distances
+        # between change points are the per-run counts.
+        values = data_df[id_column].to_numpy()
+        if len(values):
+            change = np.empty(len(values), dtype=bool)
+            change[0] = True
+            np.not_equal(values[1:], values[:-1], out=change[1:])
+            starts = np.flatnonzero(change)
+            counts = np.diff(np.append(starts, len(values)))
+
+            # Map run hole IDs to lookup keys in one vectorized pass; runs
+            # whose ID is not in the lookup are dropped, as before.
+            run_keys = pd.Series(values[starts]).map(id_to_key)
+            known = run_keys.notna().to_numpy()
+            result = pd.DataFrame(
+                {
+                    "hole_index": run_keys.to_numpy()[known].astype("int64"),
+                    "offset": starts[known],
+                    "count": counts[known],
+                }
+            )
+        else:
+            result = pd.DataFrame({"hole_index": [], "offset": [], "count": []}, dtype="int64")
 
         # Fill in missing holes with zero counts
-        all_keys = set(hole_id_lookup["key"])
-        existing_keys = {r["hole_index"] for r in records}
-        for key in all_keys - existing_keys:
-            records.append({"hole_index": key, "offset": 0, "count": 0})
+        missing_keys = hole_id_lookup.loc[~hole_id_lookup["key"].isin(result["hole_index"]), "key"]
+        if len(missing_keys):
+            zero_fill = pd.DataFrame({"hole_index": missing_keys.to_numpy(), "offset": 0, "count": 0})
+            result = pd.concat([result, zero_fill], ignore_index=True)
 
-        result = pd.DataFrame(records)
-        result = result.sort_values("offset").reset_index(drop=True)
+        result = result.sort_values("offset", kind="stable").reset_index(drop=True)
         return result
 
     def save_holes_mapping(self, holes_df: pd.DataFrame) -> dict:
@@ -940,10 +965,9 @@ class DownholeIntervalsBuilder(BaseObjectBuilder):
 
         # Build hole ID category data
         clean_ids = df[hole_id_column].fillna("").astype(str)
-        unique_ids = clean_ids.unique()
+        id_codes, unique_ids = pd.factorize(clean_ids)
         lookup_df = pd.DataFrame({"key": range(1, len(unique_ids) + 1), "value": unique_ids})
-        value_to_key = dict(zip(lookup_df["value"], lookup_df["key"]))
-        mapped_keys = clean_ids.map(value_to_key).astype("int32")
+        mapped_keys = pd.Series(id_codes + 1, index=clean_ids.index, dtype="int32")
 
         hole_id = CategoryData_V1_0_1(
             table=LookupTable_V1_0_1.from_dict(self.save_lookup_table(lookup_df)),
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Bentley Systems, Incorporated
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT_PATH = REPO_ROOT / "scripts" / "setup_mcp.py"
+
+spec = importlib.util.spec_from_file_location("setup_mcp", SCRIPT_PATH)
+if spec is None or spec.loader is None:
+    raise RuntimeError(f"Unable to load setup module from {SCRIPT_PATH}")
+
+setup_mcp = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = setup_mcp
+spec.loader.exec_module(setup_mcp)
+
+
+def _write_env(tmp_path: Path, content: str) -> Path:
+    env_file = tmp_path / ".env"
+    env_file.write_text(content, encoding="utf-8")
+    return env_file
+
+
+def test_hash_in_bare_value_is_preserved(tmp_path: Path) -> None:
+    _write_env(tmp_path, "EVO_CLIENT_SECRET=abc#def\n")
+
+    values = setup_mcp.load_env_file(tmp_path)
+
+    assert values["EVO_CLIENT_SECRET"] == "abc#def"
+
+
+def test_whitespace_preceded_comment_is_stripped(tmp_path: Path) -> None:
+    _write_env(tmp_path, "FOO=bar # trailing comment\nBAZ=qux   # another\n")
+
+    values = setup_mcp.load_env_file(tmp_path)
+
+    assert values["FOO"] == "bar"
+    assert values["BAZ"] == "qux"
+
+
+def test_quoted_values(tmp_path: Path) -> None:
+    _write_env(
+        tmp_path,
+        'A="abc#def"\nB=\'abc # def\'\nC="quoted" # comment\n',
+    )
+
+    values = setup_mcp.load_env_file(tmp_path)
+
+    assert values["A"] == "abc#def"
+    assert values["B"] == "abc # def"
+    assert values["C"] == "quoted"
+
+
+def test_export_prefix_and_blank_lines(tmp_path: Path) -> None:
+    _write_env(tmp_path, "# comment only\n\nexport FOO=bar\nEMPTY=\n")
+
+    values = setup_mcp.load_env_file(tmp_path)
+
+    assert values == {"FOO": "bar", "EMPTY": ""}
+
+
+def test_parser_agrees_with_python_dotenv(tmp_path: Path) -> None:
+    # The server reads the same .env through python-dotenv (context.py), so
+    # the setup script's parse must agree with it on these shapes.
+    env_file = _write_env(
+        tmp_path,
+        'S=abc#def\nA=abc # c\nQ="x # y"\nexport E=exported\nDUP=first\nDUP=last\n',
+    )
+
+    values = setup_mcp.load_env_file(tmp_path)
+
+    assert dict(values) == {k: v for k, v in dotenv_values(env_file).items()}
+    assert values["DUP"] == "last"
+
+
+def test_write_env_file_round_trips_hash_values(tmp_path: Path) -> None:
+    env_file = _write_env(tmp_path, "EXISTING=old # keep comment handling\n")
+
+    written = {
+        "EXISTING": "abc#def",
+        "NEW_SECRET": "tail # not a comment",
+        "PLAIN": "simple",
+    }
+    setup_mcp.write_env_file(tmp_path, written)
+
+    values = setup_mcp.load_env_file(tmp_path)
+    assert {key: values[key] for key in written} == written
+
+    # The server must read the same values back through python-dotenv.
+    assert {key: v for key, v in dotenv_values(env_file).items() if key in written} == written